@@ -0,0 +1,69 @@
+"""
+Unified command line for the optimization algorithms on a map.
+The solvers (and numpy behind them) are only imported inside the
+subcommands: `--help` and argument validation never pay for them.
+"""
+import os
+
+import click
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TELEPORT_INPUT = os.path.join(HERE, 'question_1', 'input', 'input.dat')
+PIZZA_INPUT = os.path.join(HERE, 'question_2', 'input', 'input.dat')
+INPUT_FILE = click.Path(exists=True, dir_okay=False)
+
+
+@click.group()
+def cli():
+    """
+    Optimization algorithms on a map.
+    """
+
+
+@cli.command()
+@click.option('--file', default=TELEPORT_INPUT, type=INPUT_FILE,
+              help='The path of the input file')
+def teleport(file):
+    """
+    Getting the result (longest safest path to Zearth) given the input file
+    provided.
+    :param file: the path of the input file.
+    e.g: 'question_1/input/input.dat'
+    :return:
+    """
+    # Deferred import: only a real run loads the solver and numpy
+    from question_1.classes import InputFile, Path
+
+    # Parsing the input file
+    input_file = InputFile(file)
+    stations_map = input_file.parse_file()
+
+    # Checking that the map is valid
+    stations_map.is_valid()
+
+    # Getting the safest longest teleportation trip within the map
+    path = Path(stations_map)
+    click.echo(path.get_longest_teleportation())
+
+
+@cli.command()
+@click.option('--file', default=PIZZA_INPUT, type=INPUT_FILE,
+              help='The path of the input file')
+def pizza(file):
+    """
+    Getting the result (best spot to maximize the number of accessible
+    pizzerias delivery) given the input file provided.
+    :param file: the path of the input file.
+    e.g: 'question_2/input/input.dat'
+    :return:
+    """
+    # Deferred import: only a real run loads the solver and numpy
+    from question_2.classes import InputFile
+
+    input_file = InputFile(file)
+    pizzeria_map = input_file.parse_file()
+    click.echo(pizzeria_map.get_best_location_value())
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,33 @@
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPy(build_py):
+    """
+    Leaving the per-question launchers (only runnable from their own
+    directory) and the nose tests out of the distribution.
+    """
+    excluded_modules = ('launcher', 'tests')
+
+    def find_package_modules(self, package, package_dir):
+        modules = super().find_package_modules(package, package_dir)
+        return [(package_name, module, filename)
+                for package_name, module, filename in modules
+                if module not in self.excluded_modules]
+
+
+setup(
+    name='optimization',
+    version='0.1.0',
+    description='2 optimization algorithms on a map',
+    python_requires='>=3.6',
+    py_modules=['optimization_cli'],
+    packages=['question_1', 'question_2'],
+    package_data={'question_1': ['input/*.dat'],
+                  'question_2': ['input/*.dat']},
+    install_requires=['numpy', 'click'],
+    entry_points={
+        'console_scripts': ['optimization=optimization_cli:cli'],
+    },
+    cmdclass={'build_py': BuildPy},
+)
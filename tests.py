@@ -0,0 +1,114 @@
+import os
+import re
+import subprocess
+import sys
+from unittest import SkipTest
+
+from click.testing import CliRunner
+from optimization_cli import cli
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative import time budget of the launcher module, in microseconds.
+IMPORT_TIME_BUDGET = 100000
+
+# Number of cold imports measured, the fastest one is kept.
+IMPORT_TIME_RUNS = 5
+
+SOLVER_MODULES = ('numpy', 'question_1.classes', 'question_2.classes')
+
+
+def _run_python(*args):
+    """
+    Running a fresh interpreter from the repository root so that the
+    modules already imported by the test runner do not hide the launcher
+    import cost.
+    :param args: the interpreter arguments.
+    :return obj process: the completed interpreter process.
+    """
+    return subprocess.run([sys.executable] + list(args), cwd=HERE,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+
+def _loaded_solver_modules(code):
+    """
+    Getting the solver modules loaded after running some code.
+    :param str code: the code to run in a fresh interpreter.
+    e.g: 'import optimization_cli'
+    :return str output: the sorted list of loaded solver modules.
+    e.g: "['numpy']"
+    """
+    return _run_python('-c', code + '\nimport sys\n'
+                       'print(sorted(name for name in sys.modules '
+                       'if name in {!r}))'.format(SOLVER_MODULES)).stdout
+
+
+def test_launcher_does_not_import_solvers():
+    """
+    Testing that importing the launcher loads neither numpy nor the solvers.
+    :return:
+    """
+    output = _loaded_solver_modules('import optimization_cli')
+    assert output.strip() == '[]'
+
+
+def test_launcher_import_time_budget():
+    """
+    Testing that the launcher import stays within its time budget.
+    n.b: `-X importtime` (python 3.7+) reports the cumulative import time of
+    each module (in microseconds) on stderr. We keep the fastest of several
+    runs so that a noisy machine does not fail the test.
+    :return:
+    """
+    if sys.version_info < (3, 7):
+        raise SkipTest('-X importtime requires python 3.7')
+    import_times = []
+    for _ in range(IMPORT_TIME_RUNS):
+        output = _run_python('-X', 'importtime', '-c',
+                             'import optimization_cli').stderr
+        match = re.search(r'\|\s*(\d+)\s*\|\s*optimization_cli$', output,
+                          re.MULTILINE)
+        assert match, output
+        import_times.append(int(match.group(1)))
+    assert min(import_times) < IMPORT_TIME_BUDGET
+
+
+def test_missing_file():
+    """
+    Testing that a missing input file is rejected before solving anything.
+    :return:
+    """
+    result = CliRunner().invoke(cli, ['teleport', '--file', 'missing.dat'])
+    assert result.exit_code == 2
+    assert 'does not exist' in result.output
+
+
+def test_missing_file_does_not_import_solvers():
+    """
+    Testing that a rejected input file loads neither numpy nor the solvers.
+    :return:
+    """
+    output = _loaded_solver_modules(
+        'from click.testing import CliRunner\n'
+        'from optimization_cli import cli\n'
+        'CliRunner().invoke(cli, ["teleport", "--file", "missing.dat"])')
+    assert output.strip() == '[]'
+
+
+def test_teleport():
+    """
+    End-2-end test for the teleport subcommand.
+    :return:
+    """
+    result = CliRunner().invoke(cli, ['teleport'])
+    assert result.output == '2.00\n'
+
+
+def test_pizza():
+    """
+    End-2-end test for the pizza subcommand.
+    :return:
+    """
+    result = CliRunner().invoke(cli, ['pizza'])
+    assert result.output == '2\n'